@@ -13,12 +13,12 @@ DEFAULT_MODE = "human"
 class AIPlayer(OpenAIAgent):
     """ The AI player in the reverse turing test game. """
 
-    def __init__(self, mode: str = DEFAULT_MODE):
+    def __init__(self, mode: str = DEFAULT_MODE, model: str = DEFAULT_MODEL):
         self._mode = mode
         rules = "You are a player in a reverse turing test game. Your goal is " \
             f"to convince the user that you are an {mode} by responding to " \
             "the user's questions."
-        super().__init__(rules, DEFAULT_MODEL)
+        super().__init__(rules, model)
 
     @property
     def mode(self):
@@ -8,27 +8,44 @@ turing test game.
 from .openai_agent import OpenAIAgent
 
 RULES = "You are an assistant in a reverse turing test game. Your role is to " \
-    "engage with two players (Player A and Player B) by asking them questions " \
-    "and analyzing their responses. One player is human and one is an AI System." \
-    "Your task is to determine which is human and which is an AI System. " \
-    "Player A's messages will be prefixed with 'Player A:' and Player B's " \
-    "will be prefixed with 'Player B:'."
+    "engage with {count} players ({players}) by asking them questions and " \
+    "analyzing their responses. One player is human and {others}. Your task " \
+    "is to determine which player is human. Each player's messages will be " \
+    "prefixed with their label (e.g. '{example}:')."
 
-QUESTION_PROMPT = "Ask a question to both players. The question " \
+QUESTION_PROMPT = "Ask a question to all players. The question " \
     "can be completely new or it can be related to the previous questions " \
     "or responses."
 
-FINAL_PROMPT = "Analyze the responses from both players and determine which " \
-    "user is an AI system and which is human."
+FINAL_PROMPT = "Analyze the responses from all players ({players}) and " \
+    "determine which player is human and which {ai}."
 
+DEFAULT_LABELS = ("A", "B")
 DEFAULT_MODEL = "gpt-4o-mini"
 
 class Interrogator(OpenAIAgent):
     """ The OpenAI interrogator for the Reverse Turing Test game. """
 
-    def __init__(self):
-        super().__init__(RULES, DEFAULT_MODEL)
-    
+    def __init__(self, labels: tuple[str, ...] = DEFAULT_LABELS):
+        super().__init__(format_rules(labels), DEFAULT_MODEL)
+        self._labels = tuple(labels)
+
+    @property
+    def labels(self):
+        """ Get the labels of the players in the game. """
+        return self._labels
+
+    def set_labels(self, labels: tuple[str, ...]):
+        """ Set the player labels and reset the chat history.
+
+        Args:
+            labels (tuple[str, ...]): The labels of the players, in order.
+        """
+        self._labels = tuple(labels)
+        self._chat_history = [
+            {"role": "developer", "content": format_rules(self._labels)}
+        ]
+
     def add_player_message(self, message: str, role: str):
         """ Add a message from the player to the chat history. """
         self._chat_history.append(
@@ -50,7 +67,31 @@ class Interrogator(OpenAIAgent):
     def add_developer_final_prompt(self):
         """ Add a final prompt from the developer to the chat history. """
         self._chat_history.append(
-            {"role": "developer", "content": FINAL_PROMPT}
+            {"role": "developer", "content": format_final_prompt(self._labels)}
         )
 
-    
\ No newline at end of file
+
+def format_players(labels: tuple[str, ...]) -> str:
+    """ Format player labels as 'Player A, Player B and Player C'. """
+    players = [f"Player {label}" for label in labels]
+    if len(players) < 2:
+        return "".join(players)
+    return ", ".join(players[:-1]) + f" and {players[-1]}"
+
+
+def format_rules(labels: tuple[str, ...]) -> str:
+    """ Format the interrogator rules for the given player labels. """
+    others = "one is an AI system" if len(labels) == 2 \
+        else "the others are AI systems"
+    return RULES.format(
+        count=len(labels),
+        players=format_players(labels),
+        others=others,
+        example=f"Player {labels[0]}"
+    )
+
+
+def format_final_prompt(labels: tuple[str, ...]) -> str:
+    """ Format the final prompt for the given player labels. """
+    ai = "is an AI system" if len(labels) == 2 else "are AI systems"
+    return FINAL_PROMPT.format(players=format_players(labels), ai=ai)
@@ -7,9 +7,11 @@ Defines the User Interface for the Reverse Turing Test game.
 import os
 import json
 import shlex
+import string
 import random
 
 from cmd import Cmd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from openai import OpenAIError
 
@@ -53,11 +55,11 @@ ABOUT = """
 
     In this game, you act as one of the players in a reverse turing test game
     where the interrogator is a machine. You are trying to convince an LLM-based
-    interrogator that you are a human, while an LLM-based AI player is trying 
-    to convince the interrogator that it is also human.
+    interrogator that you are a human, while one or more LLM-based AI players
+    are trying to convince the interrogator that they are also human.
 
-    You can configure the interrogator and the AI player to use different models
-    and modes with the 'configure' command.
+    You can configure the number of AI players, and the interrogator and each
+    AI player to use different models and modes with the 'configure' command.
 """
 
 class ReverseTuringTestUI(Cmd):
@@ -76,13 +78,11 @@ class ReverseTuringTestUI(Cmd):
 
         try:
             self._interrogator = Interrogator()
-            self._player = AIPlayer()
+            self._players = [AIPlayer()]
 
         except OpenAIError:
             print("No OpenAI API token found.")
             self._set_token()
-            self._interrogator = Interrogator()
-            self._player = AIPlayer()
 
     def default(self, line):
         """ Method called when command is not recognized. """
@@ -103,51 +103,67 @@ class ReverseTuringTestUI(Cmd):
     def do_start(self, line):
         """ Start the reverse turing test game against the LLM.
         
-        Use the 'configure' command to set the models for the interrogator and
-        the AI player up before starting.
+        Use the 'configure' command to set the number of AI players and the
+        models for the interrogator and the AI players up before starting.
+
+        The human and the AI players are seated in a random order and labeled
+        A, B, C, ... in that order. Each round, all AI player responses are
+        requested concurrently while the human types their answer.
 
         Usage:
             start
         """
-        self._interrogator.reset_conversation()
-        self._player.reset_conversation()
-
-        role, ai_role = ("A", "B") if random.random() < 0.5 else ("B", "A")
-        print(f"\nStarting Reverse Turing Test game. You are Player {role}.")
-
-        for round_num in range(1, self._rounds + 1):
-            print(f"\n=== Round {round_num}/{self._rounds} ===")
-
-            self._interrogator.add_developer_question_prompt()
-            question = self._interrogator.get_response()
-            if question is None:
-                return None
-
-            self._interrogator.add_assistant_message(question)
-            self._player.add_interrogator_message(question)
-            pretty_print("(Interrogator): ", question)
-
-            human_response = get_user_input(f"(Player {role}): ")
-                
-            ai_response = self._player.get_response()
-            if ai_response is None:
-                return None
-
-            if role == "A":
-                self._interrogator.add_player_message(human_response, role)
-                self._interrogator.add_player_message(ai_response, ai_role)
-                self._player.add_player_message(ai_response)
+        labels = tuple(string.ascii_uppercase[:len(self._players) + 1])
+        seats = [None, *self._players]
+        random.shuffle(seats)
+        role = labels[seats.index(None)]
+        ai_seats = {
+            label: player for label, player in zip(labels, seats)
+            if player is not None
+        }
 
-            else:
-                self._interrogator.add_player_message(ai_response, ai_role)
-                self._interrogator.add_player_message(human_response, role)
-                self._player.add_player_message(ai_response)
+        self._interrogator.set_labels(labels)
+        for player in self._players:
+            player.reset_conversation()
+
+        print(f"\nStarting Reverse Turing Test game with {len(labels)} "
+              f"players. You are Player {role}.")
+
+        with ThreadPoolExecutor(max_workers=len(ai_seats)) as executor:
+            for round_num in range(1, self._rounds + 1):
+                print(f"\n=== Round {round_num}/{self._rounds} ===")
+
+                self._interrogator.add_developer_question_prompt()
+                question = self._interrogator.get_response()
+                if question is None:
+                    return None
+
+                self._interrogator.add_assistant_message(question)
+                for player in ai_seats.values():
+                    player.add_interrogator_message(question)
+                pretty_print("(Interrogator): ", question)
+
+                futures = {
+                    label: executor.submit(player.get_response)
+                    for label, player in ai_seats.items()
+                }
+                responses = {role: get_user_input(f"(Player {role}): ")}
+                for label, future in futures.items():
+                    responses[label] = future.result()
+                    if responses[label] is None:
+                        return None
+                    ai_seats[label].add_player_message(responses[label])
+
+                for label in labels:
+                    self._interrogator.add_player_message(
+                        responses[label], label
+                    )
 
         self._interrogator.add_developer_final_prompt()
         answer = self._interrogator.get_response()
         pretty_print("\n(Interrogator's Analysis): ", answer)
         self._interrogator.add_assistant_message(answer)
-        self._save_conversation(role)
+        self._save_conversation(role, ai_seats)
 
     def do_configure(self, line):
         """ Configure the reverse turing test game.
@@ -155,14 +171,16 @@ class ReverseTuringTestUI(Cmd):
         Arguments:
             setting (str): The setting to configure. Available settings are:
                 - 'interrogator': Change the interrogator model.
-                - 'player': Change the AI player model.
+                - 'player': Change the model of an AI player.
+                - 'players': Set the number of AI players (1-5). Newly added
+                    players use the default model and mode.
                 - 'rounds': Set the number of rounds to play (1-5).
-                - 'mode': Set the mode for the AI player ('human' or 'AI'). If
+                - 'mode': Set the mode of an AI player ('human' or 'AI'). If
                     the model is set to 'human' (which is the default), the AI
                     player will attempt to appear human. If the model is set to
                     'AI', the AI player will attempt to appear as an AI system.
                 - 'token': Set the OpenAI API token. Note this will reset the
-                    mode to the default 'human'.
+                    game to a single AI player in the default 'human' mode.
                 - 'username': Set the username for the game.
         Usage:
             configure <setting>
@@ -174,7 +192,8 @@ class ReverseTuringTestUI(Cmd):
             return None
         
         if args[0] not in (
-            "interrogator", "player", "token", "rounds", "mode", "username"
+            "interrogator", "player", "players", "token", "rounds", "mode",
+            "username"
         ):
             print_invalid_args("configure")
             return None
@@ -187,6 +206,10 @@ class ReverseTuringTestUI(Cmd):
             self._set_rounds()
             return None
         
+        elif args[0] == "players":
+            self._set_players()
+            return None
+        
         elif args[0] == "mode":
             self._set_mode()
             return None
@@ -225,6 +248,54 @@ class ReverseTuringTestUI(Cmd):
         self._rounds = rounds
         print(f"Successfully set number of rounds to {self._rounds}\n")
 
+    def _set_players(self):
+        """
+        Set the number of AI players. Existing players keep their model and
+        mode, new players are created with the defaults.
+        """
+        try:
+            count = int(get_user_input("Enter number of AI players: "))
+
+        except ValueError:
+            print("Please enter a valid number for AI players.\n")
+            return None
+
+        if not (0 < count <= 5):
+            print("Please enter a number between 1 and 5.\n")
+            return None
+
+        self._players = self._players[:count]
+        self._players += [AIPlayer() for _ in range(count - len(self._players))]
+        print(f"Successfully set number of AI players to {count}\n")
+
+    def _select_player(self) -> int | None:
+        """
+        Select one of the AI players to configure. If there is only one AI
+        player, it is selected without prompting.
+
+        Returns:
+            int | None: The index of the selected AI player.
+        """
+        if len(self._players) == 1:
+            return 0
+
+        print("\nAI players:")
+        for i, player in enumerate(self._players, 1):
+            print(f"{i}. {player.model} ({player.mode})")
+
+        try:
+            player_idx = int(get_user_input("\nSelect AI player: ")) - 1
+
+        except ValueError:
+            print("Please enter a valid number.\n")
+            return None
+
+        if not (0 <= player_idx < len(self._players)):
+            print("Invalid selection. Please enter a valid number.\n")
+            return None
+
+        return player_idx
+
     def _set_token(self):
         """
         Set the OpenAI API token. We recommend using the environment variable
@@ -237,20 +308,25 @@ class ReverseTuringTestUI(Cmd):
         token = get_token("Enter OpenAI API token: ")
         os.environ["OPENAI_API_KEY"] = token
         self._interrogator = Interrogator()
-        self._player = AIPlayer()
+        self._players = [AIPlayer()]
         print("Successfully set OpenAI API token\n")
 
     def _set_mode(self):
         """
-        Set the mode of the AI player.
+        Set the mode of an AI player.
         """
+        player_idx = self._select_player()
+        if player_idx is None:
+            return None
+
         mode = get_user_input("Enter mode for AI player (human or AI): ")
         
         if mode not in ["human", "AI"]:
             print("Please enter a valid mode (human or AI).\n")
             return None
         
-        self._player = AIPlayer(mode)
+        model = self._players[player_idx].model
+        self._players[player_idx] = AIPlayer(mode, model)
         print(f"Successfully set AI player mode to {mode}\n")
 
     def _set_username(self):
@@ -275,7 +351,15 @@ class ReverseTuringTestUI(Cmd):
                 ('interrogator' or 'player')
         Returns: None
         """
-        agent = self._player if agent_str == "player" else self._interrogator
+        if agent_str == "player":
+            player_idx = self._select_player()
+            if player_idx is None:
+                return None
+            agent = self._players[player_idx]
+
+        else:
+            agent = self._interrogator
+
         models = agent.models
         print("\nAvailable models:")
 
@@ -299,12 +383,13 @@ class ReverseTuringTestUI(Cmd):
                 print("Please enter a valid number.")
 
 
-    def _save_conversation(self, role: str):
+    def _save_conversation(self, role: str, ai_seats: dict[str, AIPlayer]):
         """
         Save the conversation history to a JSON file.
         
         Args:
-            role (str): The role the human player had ('A' or 'B')
+            role (str): The role the human player had (e.g. 'A' or 'B')
+            ai_seats (dict[str, AIPlayer]): The AI players keyed by their role
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"conversation_{timestamp}.json"
@@ -314,10 +399,16 @@ class ReverseTuringTestUI(Cmd):
             "human_role": role,
             "username": self._username,
             "interrogator_model": self._interrogator.model,
-            "ai_player_model": self._player.model,
-            "ai_player_mode": self._player.mode,
             "interrogator_history": self._interrogator._chat_history,
-            "ai_player_history": self._player._chat_history
+            "ai_players": [
+                {
+                    "role": label,
+                    "model": player.model,
+                    "mode": player.mode,
+                    "history": player._chat_history
+                }
+                for label, player in ai_seats.items()
+            ]
         }
 
         try: